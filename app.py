@@ -1,32 +1,46 @@
 import os
+import sys
+import queue
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+import logging.handlers
+import threading
+from concurrent.futures import Future
+from typing import List, Dict, Any, Optional, Union
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, Depends, status, Query
+from fastapi import FastAPI, HTTPException, Depends, status, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
 from dotenv import load_dotenv
+import httpx
+import msgspec
+import orjson
 import structlog
 
 from mem0 import Memory
+from qdrant_client import models
 
 # Load environment variables
 load_dotenv()
 
+# Provider settings are fixed for the life of the process, so read them once
+LLM_PROVIDER = os.getenv('LLM_PROVIDER', 'azure_openai')
+STORAGE_PROVIDER = os.getenv('STORAGE_PROVIDER', 'none')
+
+def orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson, returning str for the stdlib logger"""
+    return orjson.dumps(obj, **kwargs).decode()
+
 # Configure structured logging
 structlog.configure(
     processors=[
         structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
         structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer()
+        structlog.processors.JSONRenderer(serializer=orjson_dumps)
     ],
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
@@ -34,24 +48,73 @@ structlog.configure(
     cache_logger_on_first_use=True,
 )
 
-logger = structlog.get_logger()
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that counts and drops records when the queue is full"""
+    
+    dropped = 0
+    
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # The default path reports every failed put as a traceback on stderr
+            self.dropped += 1
+
+# Hand log records to a background thread so request handlers never block on stdout.
+# Only the app's own logger is routed there; third-party loggers keep logging's defaults
+APP_LOGGER_NAME = "mem0_api"
+log_queue = queue.Queue(maxsize=10000)
+log_queue_handler = DroppingQueueHandler(log_queue)
+app_logger = logging.getLogger(APP_LOGGER_NAME)
+app_logger.addHandler(log_queue_handler)
+app_logger.setLevel(os.getenv('LOG_LEVEL', 'INFO').upper())
+app_logger.propagate = False
+log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+
+logger = structlog.get_logger(APP_LOGGER_NAME)
 
 # Pydantic models for API requests and responses
+# Models are immutable and reject unknown fields; Pydantic v2 models have no __slots__ option
+STRICT_MODEL_CONFIG = ConfigDict(extra='forbid', frozen=True)
+
+# Qdrant rejects limits below 1; the cap keeps one search from pulling a whole collection
+MAX_SEARCH_LIMIT = 100
+# Queries are embedded as one string; longer ones are rejected before they reach the embedder
+MAX_QUERY_LENGTH = 2048
+
 class MemoryCreate(BaseModel):
-    message: str = Field(..., description="The memory content to store")
-    user_id: str = Field(..., description="User identifier")
+    model_config = STRICT_MODEL_CONFIG
+    
+    message: str = Field(..., min_length=1, max_length=8192, description="The memory content to store")
+    user_id: str = Field(..., min_length=1, max_length=128, description="User identifier")
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata")
 
+class MemoryBatchCreate(BaseModel):
+    model_config = STRICT_MODEL_CONFIG
+    
+    items: List[MemoryCreate] = Field(..., min_length=1, max_length=48, description="Memories to store")
+
 class MemoryUpdate(BaseModel):
-    message: Optional[str] = Field(None, description="Updated memory content")
+    model_config = STRICT_MODEL_CONFIG
+    
+    message: Optional[str] = Field(None, min_length=1, max_length=8192, description="Updated memory content")
     metadata: Optional[Dict[str, Any]] = Field(None, description="Updated metadata")
 
 class MemorySearch(BaseModel):
-    query: str = Field(..., description="Search query")
-    user_id: str = Field(..., description="User identifier")
-    limit: Optional[int] = Field(default=10, description="Number of results to return")
+    model_config = STRICT_MODEL_CONFIG
+    
+    query: str = Field(..., max_length=MAX_QUERY_LENGTH, description="Search query")
+    user_id: str = Field(..., min_length=1, max_length=128, description="User identifier")
+    limit: int = Field(default=10, ge=1, le=MAX_SEARCH_LIMIT, description="Number of results to return")
+
+class MemorySearchBatch(BaseModel):
+    model_config = STRICT_MODEL_CONFIG
+    
+    queries: List[MemorySearch] = Field(..., min_length=1, max_length=128, description="Searches to run together")
 
 class MemoryResponse(BaseModel):
+    model_config = STRICT_MODEL_CONFIG
+    
     id: str
     message: str
     user_id: str
@@ -60,15 +123,115 @@ class MemoryResponse(BaseModel):
     updated_at: Optional[str] = None
 
 class HealthResponse(BaseModel):
+    model_config = STRICT_MODEL_CONFIG
+    
     status: str
     version: str
     database: str
     llm_provider: str
     storage_provider: str
 
+class SearchHit(msgspec.Struct, frozen=True):
+    """A search result laid out like mem0's search() output, encoded without a schema walk"""
+    id: str
+    memory: Optional[str]
+    hash: Optional[str]
+    metadata: Optional[Dict[str, Any]]
+    score: Optional[float]
+    created_at: Optional[str]
+    updated_at: Optional[str]
+    user_id: Union[str, msgspec.UnsetType] = msgspec.UNSET
+    agent_id: Union[str, msgspec.UnsetType] = msgspec.UNSET
+    run_id: Union[str, msgspec.UnsetType] = msgspec.UNSET
+
 # Global memory instance
 memory_instance = None
 
+# Bound concurrent blocking mem0 calls so they cannot exhaust the worker thread pool.
+# Resized at startup: an embedded (path mode) Qdrant client is not thread-safe, so it gets one slot
+MAX_CONCURRENT_MEMORY_CALLS = 64
+memory_call_semaphore = asyncio.Semaphore(MAX_CONCURRENT_MEMORY_CALLS)
+
+async def run_memory_call(func, *args, **kwargs):
+    """Run a blocking mem0 call in a worker thread without blocking the event loop"""
+    async with memory_call_semaphore:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+def embed_texts(embedder, texts: List[str]) -> List[List[float]]:
+    """Embed several texts, using a single request when the provider supports it"""
+    client = getattr(embedder, "client", None)
+    if client is None or not hasattr(client, "embeddings"):
+        return [embedder.embed(text) for text in texts]
+    response = client.embeddings.create(
+        input=[text.replace("\n", " ") for text in texts],
+        model=embedder.config.model
+    )
+    return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+class BatchingEmbedder:
+    """Coalesce concurrent embed() calls from worker threads into one embeddings request"""
+    
+    def __init__(self, embedder, max_batch_size: int = 48, max_wait: float = 0.05):
+        self.embedder = embedder
+        self.config = embedder.config
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        self._pending: List[tuple] = []
+        self._timer: Optional[threading.Timer] = None
+        self._in_flight = 0
+    
+    def embed(self, text):
+        """Queue a text and block until its batch has been embedded"""
+        future = Future()
+        batch = None
+        with self._lock:
+            self._pending.append((text, future))
+            # Alone, there is nothing to coalesce with, so don't wait out the timer
+            if len(self._pending) >= self.max_batch_size or self._in_flight == 0:
+                batch = self._take_pending()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.max_wait, self._flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if batch:
+            self._run(batch)
+        return future.result()
+    
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed several texts, using a single request when the provider supports it"""
+        return embed_texts(self.embedder, texts)
+    
+    def _take_pending(self) -> List[tuple]:
+        batch, self._pending = self._pending, []
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if batch:
+            self._in_flight += 1
+        return batch
+    
+    def _flush(self):
+        with self._lock:
+            batch = self._take_pending()
+        if batch:
+            self._run(batch)
+    
+    def _run(self, batch: List[tuple]):
+        try:
+            vectors = self.embed_batch([text for text, _ in batch])
+            if len(vectors) != len(batch):
+                raise ValueError(f"Embedding provider returned {len(vectors)} vectors for {len(batch)} inputs")
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+        for (_, future), vector in zip(batch, vectors):
+            future.set_result(vector)
+
 def validate_environment():
     """Validate that all required environment variables are set"""
     llm_provider = os.getenv('LLM_PROVIDER', 'azure_openai')
@@ -99,7 +262,8 @@ def get_mem0_config():
             "provider": "qdrant",
             "config": {
                 "path": "/app/qdrant_data",
-                "collection_name": "mem0"
+                "collection_name": "mem0",
+                "on_disk": True
             }
         },
         "embedder": {
@@ -146,10 +310,171 @@ def get_mem0_config():
     
     return config
 
+def uses_embedded_vector_store(config: Dict[str, Any]) -> bool:
+    """Whether Qdrant runs in-process on a local path rather than as a server"""
+    store_config = config["vector_store"]["config"]
+    return "path" in store_config and not (store_config.get("host") or store_config.get("url"))
+
+def tune_vector_store(memory: Memory):
+    """Apply the HNSW, quantization and optimizer settings mem0's Qdrant config does not expose"""
+    applied = memory.vector_store.client.update_collection(
+        collection_name=memory.vector_store.collection_name,
+        hnsw_config=models.HnswConfigDiff(m=16, ef_construct=128, on_disk=True),
+        quantization_config=models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(
+                type=models.ScalarType.INT8,
+                quantile=0.99,
+                always_ram=True
+            )
+        ),
+        optimizers_config=models.OptimizersConfigDiff(memmap_threshold=20000, indexing_threshold=20000)
+    )
+    if not applied:
+        logger.warning("Vector store tuning was not applied",
+                      collection=memory.vector_store.collection_name)
+
+def share_http_client(memory: Memory, http_client: httpx.Client):
+    """Point mem0's OpenAI-style LLM and embedder clients at one shared connection pool"""
+    for component in (memory.llm, memory.embedding_model):
+        client = getattr(component, "client", None)
+        if client is not None and hasattr(client, "with_options"):
+            component.client = client.with_options(http_client=http_client)
+
+# Payload keys mem0 reserves for itself; everything else is user metadata
+MEM0_PAYLOAD_KEYS = frozenset({"user_id", "agent_id", "run_id", "hash", "data", "created_at", "updated_at"})
+
+def format_search_hit(point) -> SearchHit:
+    """Shape a Qdrant scored point the same way mem0's search() does"""
+    payload = point.payload or {}
+    metadata = {key: value for key, value in payload.items() if key not in MEM0_PAYLOAD_KEYS}
+    return SearchHit(
+        id=str(point.id),
+        memory=payload.get("data"),
+        hash=payload.get("hash"),
+        metadata=metadata or None,
+        score=point.score,
+        created_at=payload.get("created_at"),
+        updated_at=payload.get("updated_at"),
+        **{key: payload[key] for key in ("user_id", "agent_id", "run_id") if key in payload}
+    )
+
+def json_response(content: Any) -> Response:
+    """Encode a response body with msgspec, skipping FastAPI's jsonable_encoder pass"""
+    return Response(content=msgspec.json.encode(content), media_type="application/json")
+
+async def stream_json_list(key: str, items: List[Any], chunk_size: int = 32):
+    """Yield {key: [...], "count": n} as JSON, encoding a chunk of records at a time"""
+    yield b"{" + msgspec.json.encode(key) + b":["
+    for start in range(0, len(items), chunk_size):
+        chunk = b",".join(msgspec.json.encode(item) for item in items[start:start + chunk_size])
+        yield (b"," if start else b"") + chunk
+    yield b'],"count":' + str(len(items)).encode() + b"}"
+
+def streaming_json_list(key: str, items: List[Any]) -> StreamingResponse:
+    """Stream a list of records without building the whole response body in memory"""
+    return StreamingResponse(stream_json_list(key, items), media_type="application/json")
+
+def search_memories_batch(memory: Memory, queries: List[MemorySearch]) -> List[List[SearchHit]]:
+    """Embed all queries at once and run them as a single Qdrant batch query"""
+    texts = [query.query for query in queries]
+    embedder = memory.embedding_model
+    if isinstance(embedder, BatchingEmbedder):
+        embedder = embedder.embedder
+    vectors = embed_texts(embedder, texts)
+    
+    batch_requests = [
+        models.QueryRequest(
+            query=vector,
+            limit=query.limit,
+            filter=models.Filter(must=[
+                models.FieldCondition(key="user_id", match=models.MatchValue(value=query.user_id))
+            ]),
+            with_payload=True
+        )
+        for query, vector in zip(queries, vectors)
+    ]
+    responses = memory.vector_store.client.query_batch_points(
+        collection_name=memory.vector_store.collection_name,
+        requests=batch_requests
+    )
+    return [[format_search_hit(point) for point in response.points] for response in responses]
+
+class SearchBatcher:
+    """Coalesce concurrent single searches into Qdrant batch queries"""
+    
+    def __init__(self, memory: Memory, max_batch_size: int = 32, max_wait: float = 0.05):
+        self.memory = memory
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        self._dispatches: set = set()
+    
+    def start(self):
+        self._task = asyncio.create_task(self._collect())
+    
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await asyncio.gather(*self._dispatches, return_exceptions=True)
+    
+    async def submit(self, query: str, user_id: str, limit: int) -> List[SearchHit]:
+        """Queue a search and wait for the batch it lands in"""
+        future = asyncio.get_running_loop().create_future()
+        # Query parameters were already validated by FastAPI, so skip re-validation here
+        search = MemorySearch.model_construct(query=query, user_id=user_id, limit=limit)
+        await self._queue.put((search, future))
+        return await future
+    
+    async def _collect(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            # Only hold searches back to gather more while an earlier batch is still running;
+            # a lone search goes out at once
+            deadline = loop.time() + self.max_wait
+            while self._dispatches and len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+    
+    async def _dispatch(self, batch: List[tuple]):
+        try:
+            results = await run_memory_call(search_memories_batch, self.memory, [search for search, _ in batch])
+        except Exception as e:
+            if len(batch) > 1:
+                # Don't let one bad search fail the requests it happened to be batched with
+                await asyncio.gather(*(self._dispatch([item]) for item in batch))
+                return
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), hits in zip(batch, results):
+            if not future.done():
+                future.set_result(hits)
+
+# Global search batcher, started alongside the memory instance
+search_batcher: Optional[SearchBatcher] = None
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
-    global memory_instance
+    global memory_instance, search_batcher, memory_call_semaphore
+    
+    log_listener.start()
+    http_client = None
     
     try:
         # Validate environment variables
@@ -158,10 +483,26 @@ async def lifespan(app: FastAPI):
         # Initialize Mem0
         config = get_mem0_config()
         memory_instance = Memory.from_config(config)
+        if uses_embedded_vector_store(config):
+            memory_call_semaphore = asyncio.Semaphore(1)
+            # Embedded Qdrant ignores collection updates, so there is nothing to tune
+            logger.info("Skipping vector store tuning for embedded Qdrant")
+        else:
+            tune_vector_store(memory_instance)
+        http_client = httpx.Client(
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+            http2=True
+        )
+        share_http_client(memory_instance, http_client)
+        if not uses_embedded_vector_store(config):
+            # With mem0 calls serialized for embedded Qdrant, embeds never overlap, so there is nothing to coalesce
+            memory_instance.embedding_model = BatchingEmbedder(memory_instance.embedding_model)
+        search_batcher = SearchBatcher(memory_instance)
+        search_batcher.start()
         
         logger.info("Mem0 application started successfully", 
-                   llm_provider=os.getenv('LLM_PROVIDER'),
-                   storage_provider=os.getenv('STORAGE_PROVIDER', 'none'))
+                   llm_provider=LLM_PROVIDER,
+                   storage_provider=STORAGE_PROVIDER)
         
         yield
         
@@ -170,6 +511,13 @@ async def lifespan(app: FastAPI):
         raise
     finally:
         logger.info("Mem0 application shutting down")
+        if search_batcher is not None:
+            await search_batcher.stop()
+        if http_client is not None:
+            http_client.close()
+        if log_queue_handler.dropped:
+            logger.warning("Log records dropped on a full queue", count=log_queue_handler.dropped)
+        log_listener.stop()
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -178,6 +526,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -199,32 +548,38 @@ def get_memory() -> Memory:
         )
     return memory_instance
 
-@app.get("/health", response_model=HealthResponse)
-async def health_check():
-    """Health check endpoint"""
-    try:
-        return HealthResponse(
-            status="healthy",
-            version="1.0.0",
-            database="postgres",
-            llm_provider=os.getenv('LLM_PROVIDER', 'azure_openai'),
-            storage_provider=os.getenv('STORAGE_PROVIDER', 'none')
-        )
-    except Exception as e:
-        logger.error("Health check failed", error=str(e))
+def get_search_batcher() -> SearchBatcher:
+    """Dependency to get the search batcher"""
+    if search_batcher is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Service unhealthy"
+            detail="Memory service is not available"
         )
+    return search_batcher
 
-@app.post("/memory", response_model=Dict[str, str])
+# The health payload only depends on process-level settings, so encode it once
+HEALTH_JSON = orjson.dumps({
+    "status": "healthy",
+    "version": "1.0.0",
+    "database": "qdrant",
+    "llm_provider": LLM_PROVIDER,
+    "storage_provider": STORAGE_PROVIDER
+})
+
+@app.get("/health", responses={200: {"model": HealthResponse}})
+async def health_check():
+    """Health check endpoint"""
+    return Response(content=HEALTH_JSON, media_type="application/json")
+
+@app.post("/memory")
 async def add_memory(
     memory_data: MemoryCreate,
     memory: Memory = Depends(get_memory)
 ):
     """Add a new memory"""
     try:
-        result = memory.add(
+        result = await run_memory_call(
+            memory.add,
             memory_data.message,
             user_id=memory_data.user_id,
             metadata=memory_data.metadata or {}
@@ -245,27 +600,59 @@ async def add_memory(
             detail=f"Failed to add memory: {str(e)}"
         )
 
+@app.post("/memory/batch")
+async def add_memories_batch(
+    batch_data: MemoryBatchCreate,
+    memory: Memory = Depends(get_memory)
+):
+    """Add several memories; against a Qdrant server they run concurrently and share embedding requests"""
+    try:
+        results = await asyncio.gather(*(
+            run_memory_call(
+                memory.add,
+                item.message,
+                user_id=item.user_id,
+                metadata=item.metadata or {}
+            )
+            for item in batch_data.items
+        ))
+        
+        logger.info("Memory batch added successfully", 
+                   count=len(results),
+                   user_ids=sorted({item.user_id for item in batch_data.items}))
+        
+        return {
+            "message": "Memories added successfully",
+            "results": [str(result) for result in results],
+            "count": len(results)
+        }
+        
+    except Exception as e:
+        logger.error("Failed to add memory batch", 
+                    count=len(batch_data.items),
+                    error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to add memories: {str(e)}"
+        )
+
 @app.get("/memory/search")
 async def search_memories(
-    query: str = Query(..., description="Search query"),
+    query: str = Query(..., max_length=MAX_QUERY_LENGTH, description="Search query"),
     user_id: str = Query(..., description="User identifier"),
-    limit: int = Query(10, description="Number of results to return"),
-    memory: Memory = Depends(get_memory)
+    limit: int = Query(10, ge=1, le=MAX_SEARCH_LIMIT, description="Number of results to return"),
+    batcher: SearchBatcher = Depends(get_search_batcher)
 ):
     """Search memories"""
     try:
-        results = memory.search(
-            query=query,
-            user_id=user_id,
-            limit=limit
-        )
+        results = await batcher.submit(query, user_id, limit)
         
         logger.info("Memory search completed", 
                    user_id=user_id,
                    query=query,
                    results_count=len(results))
         
-        return {"results": results, "count": len(results)}
+        return json_response({"results": results, "count": len(results)})
         
     except Exception as e:
         logger.error("Failed to search memories", 
@@ -277,6 +664,33 @@ async def search_memories(
             detail=f"Failed to search memories: {str(e)}"
         )
 
+@app.post("/memory/search/batch")
+async def search_memories_batch_endpoint(
+    batch_data: MemorySearchBatch,
+    memory: Memory = Depends(get_memory)
+):
+    """Run several searches with one embedding call and one Qdrant round-trip"""
+    try:
+        results = await run_memory_call(search_memories_batch, memory, batch_data.queries)
+        
+        logger.info("Memory batch search completed", 
+                   count=len(results),
+                   results_count=sum(len(hits) for hits in results))
+        
+        return json_response({
+            "results": [{"results": hits, "count": len(hits)} for hits in results],
+            "count": len(results)
+        })
+        
+    except Exception as e:
+        logger.error("Failed to search memory batch", 
+                    count=len(batch_data.queries),
+                    error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to search memories: {str(e)}"
+        )
+
 @app.get("/memory/user/{user_id}")
 async def get_all_memories(
     user_id: str,
@@ -284,13 +698,13 @@ async def get_all_memories(
 ):
     """Get all memories for a user"""
     try:
-        results = memory.get_all(user_id=user_id)
+        results = await run_memory_call(memory.get_all, user_id=user_id)
         
         logger.info("Retrieved all memories for user", 
                    user_id=user_id,
                    count=len(results))
         
-        return {"memories": results, "count": len(results)}
+        return streaming_json_list("memories", results)
         
     except Exception as e:
         logger.error("Failed to get all memories", 
@@ -301,6 +715,28 @@ async def get_all_memories(
             detail=f"Failed to get memories: {str(e)}"
         )
 
+@app.delete("/memory/user/{user_id}")
+async def delete_user_memories(
+    user_id: str,
+    memory: Memory = Depends(get_memory)
+):
+    """Delete all memories for a user"""
+    try:
+        await run_memory_call(memory.delete_all, user_id=user_id)
+        
+        logger.info("Deleted all memories for user", user_id=user_id)
+        
+        return {"message": "Memories deleted successfully"}
+        
+    except Exception as e:
+        logger.error("Failed to delete user memories", 
+                    user_id=user_id,
+                    error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to delete memories: {str(e)}"
+        )
+
 @app.get("/memory/{memory_id}")
 async def get_memory_by_id(
     memory_id: str,
@@ -308,7 +744,7 @@ async def get_memory_by_id(
 ):
     """Get memory by ID"""
     try:
-        result = memory.get(memory_id)
+        result = await run_memory_call(memory.get, memory_id)
         
         if not result:
             raise HTTPException(
@@ -351,7 +787,7 @@ async def update_memory(
                 detail="No update data provided"
             )
         
-        result = memory.update(memory_id, **update_data)
+        result = await run_memory_call(memory.update, memory_id, **update_data)
         
         logger.info("Memory updated successfully", 
                    memory_id=memory_id,
@@ -377,7 +813,7 @@ async def delete_memory(
 ):
     """Delete memory by ID"""
     try:
-        memory.delete(memory_id)
+        await run_memory_call(memory.delete, memory_id)
         
         logger.info("Memory deleted successfully", memory_id=memory_id)
         
@@ -400,13 +836,13 @@ async def get_memory_history(
 ):
     """Get memory history for a user"""
     try:
-        results = memory.history(user_id=user_id, limit=limit)
+        results = await run_memory_call(memory.history, user_id=user_id, limit=limit)
         
         logger.info("Retrieved memory history", 
                    user_id=user_id,
                    count=len(results))
         
-        return {"history": results, "count": len(results)}
+        return streaming_json_list("history", results)
         
     except Exception as e:
         logger.error("Failed to get memory history", 
@@ -441,6 +877,8 @@ if __name__ == "__main__":
         "app:app",
         host="0.0.0.0",
         port=8000,
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
         reload=True,
         log_config=None  # Use structlog configuration
     )
\ No newline at end of file
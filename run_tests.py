@@ -6,6 +6,7 @@ import subprocess
 import argparse
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
 
 
@@ -13,24 +14,34 @@ def check_api_health(base_url="http://localhost:8000", timeout=30):
     """Check if the API is healthy and ready for testing."""
     print(f"Checking API health at {base_url}/health...")
     
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        try:
-            response = requests.get(f"{base_url}/health", timeout=5)
-            if response.status_code == 200:
-                health_data = response.json()
-                print(f"✅ API is healthy: {health_data['status']}")
-                print(f"   Database: {health_data['database']}")
-                print(f"   LLM Provider: {health_data['llm_provider']}")
-                print(f"   Storage Provider: {health_data['storage_provider']}")
-                return True
-        except requests.exceptions.RequestException as e:
-            pass
+    # Reuse one connection across polls instead of reconnecting every time
+    with requests.Session() as session:
+        session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
         
-        print("⏳ Waiting for API to be ready...")
-        time.sleep(2)
+        # Poll quickly at first and back off, so an already-ready API is detected immediately
+        delay = 0.05
+        waiting_reported = False
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                response = session.get(f"{base_url}/health", timeout=5)
+                if response.ok:
+                    health_data = response.json()
+                    print(f"✅ API is healthy: {health_data['status']}")
+                    print(f"   Database: {health_data['database']}")
+                    print(f"   LLM Provider: {health_data['llm_provider']}")
+                    print(f"   Storage Provider: {health_data['storage_provider']}")
+                    return True
+            except requests.exceptions.RequestException:
+                pass
+            
+            if not waiting_reported:
+                print("⏳ Waiting for API to be ready...")
+                waiting_reported = True
+            time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+            delay = min(delay * 1.6, 1.0)
     
-    print("❌ API is not responding after {timeout} seconds")
+    print(f"❌ API is not responding after {timeout} seconds")
     return False
 
 
@@ -48,10 +59,14 @@ def install_test_dependencies():
         return False
 
 
-def run_tests(test_type="all", verbose=False, coverage=False):
+def run_tests(test_type="all", verbose=False, coverage=False, workers="auto"):
     """Run the specified test suite."""
     cmd = [sys.executable, "-m", "pytest"]
     
+    # Spread tests over worker processes; loadscope keeps each class on one worker
+    if workers != "0":
+        cmd.extend(["-n", workers, "--dist=loadscope"])
+    
     # Add verbosity
     if verbose:
         cmd.append("-v")
@@ -72,7 +87,8 @@ def run_tests(test_type="all", verbose=False, coverage=False):
     elif test_type == "fast":
         cmd.extend(["-m", "not slow"])
     elif test_type == "all":
-        pass  # Run all tests
+        # Override pytest.ini's default "not slow" filter
+        cmd.extend(["-m", "slow or not slow"])
     else:
         cmd.append(f"tests/test_{test_type}.py")
     
@@ -115,6 +131,11 @@ def main():
         action="store_true", 
         help="Skip API health check"
     )
+    parser.add_argument(
+        "--workers", "-n",
+        default="auto",
+        help="Number of parallel pytest-xdist workers, or 0 to run serially (default: auto)"
+    )
     parser.add_argument(
         "--api-url",
         default="http://localhost:8000",
@@ -144,7 +165,8 @@ def main():
     success = run_tests(
         test_type=args.type,
         verbose=args.verbose,
-        coverage=args.coverage
+        coverage=args.coverage,
+        workers=args.workers
     )
     
     if success:
@@ -2,6 +2,7 @@
 """Quick test summary and demo for the mem0 API test suite."""
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 
@@ -13,21 +14,23 @@ def main():
     print("=" * 50)
     
     # Check API health
-    try:
-        health_response = requests.get(f"{base_url}/health", timeout=5)
-        if health_response.status_code == 200:
-            health_data = health_response.json()
-            print("✅ API Status: Healthy")
-            print(f"   Database: {health_data['database']}")
-            print(f"   LLM Provider: {health_data['llm_provider']}")
-            print(f"   Storage: {health_data['storage_provider']}")
-        else:
-            print(f"❌ API Status: Unhealthy (HTTP {health_response.status_code})")
+    with requests.Session() as session:
+        session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        try:
+            health_response = session.get(f"{base_url}/health", timeout=5)
+            if health_response.status_code == 200:
+                health_data = health_response.json()
+                print("✅ API Status: Healthy")
+                print(f"   Database: {health_data['database']}")
+                print(f"   LLM Provider: {health_data['llm_provider']}")
+                print(f"   Storage: {health_data['storage_provider']}")
+            else:
+                print(f"❌ API Status: Unhealthy (HTTP {health_response.status_code})")
+                return
+        except Exception as e:
+            print(f"❌ API Status: Not responding ({e})")
+            print("💡 Run: docker-compose up -d")
             return
-    except Exception as e:
-        print(f"❌ API Status: Not responding ({e})")
-        print("💡 Run: docker-compose up -d")
-        return
     
     print("\n📋 Test Suite Contents:")
     print("   • Health endpoint tests (3 tests)")
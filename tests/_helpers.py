@@ -0,0 +1,28 @@
+"""Assertion and decoding helpers shared by the test modules."""
+
+from typing import Any, Dict
+
+import httpx
+import orjson
+
+# Fields mem0 returns for a stored memory; metadata is present whenever the memory was created with some
+_REQUIRED_MEMORY_FIELDS = frozenset({"id", "memory", "user_id", "metadata"})
+_SUCCESS_STATUS_CODES = frozenset({200, 201})
+
+
+def _json(response: httpx.Response) -> Any:
+    """Decode a JSON response body with orjson."""
+    return orjson.loads(response.content)
+
+
+def assert_memory_structure(memory: Dict[str, Any]) -> None:
+    """Assert that a memory object has the expected structure."""
+    missing = _REQUIRED_MEMORY_FIELDS - memory.keys()
+    assert not missing, f"Memory is missing fields {sorted(missing)}: {memory}"
+    assert isinstance(memory["metadata"], dict)
+
+
+def assert_response_success(response: httpx.Response) -> None:
+    """Assert that a response is successful."""
+    assert response.status_code in _SUCCESS_STATUS_CODES, f"Expected success but got {response.status_code}: {response.text}"
+    assert response.headers.get("content-type", "").startswith("application/json")
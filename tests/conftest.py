@@ -1,9 +1,47 @@
 """Test configuration and fixtures for mem0 API tests."""
 
+import re
+import uuid
+import asyncio
+import httpx
 import pytest
-import requests
-import time
-from typing import Dict, Any, Optional
+import pytest_asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Set, Tuple
+from urllib.parse import quote
+from tests._helpers import _json
+from tests.routes import HEALTH, MEMORY, MEMORY_BATCH, SEARCH, USER
+
+# Every user_id that got a memory created this session, deleted once at session end
+_created_users: Set[str] = set()
+
+# Throwaway user for the session warm-up requests
+_WARMUP_USER_ID = "__warmup__"
+
+# Payload of the standard sample memory, without the owning user
+_SAMPLE_MEMORY = {
+    "message": "User prefers morning meetings and coffee",
+    "metadata": {
+        "category": "preferences",
+        "importance": "high",
+        "tags": ["meetings", "coffee"]
+    }
+}
+
+
+def _track_created_user(response: httpx.Response) -> None:
+    """Response hook recording the owner of every memory created through the test clients."""
+    request = response.request
+    if request.method != "POST" or not response.is_success:
+        return
+    if request.url.path == MEMORY:
+        _created_users.add(_json(request)["user_id"])
+    elif request.url.path == MEMORY_BATCH:
+        _created_users.update(item["user_id"] for item in _json(request)["items"])
+
+
+async def _track_created_user_async(response: httpx.Response) -> None:
+    _track_created_user(response)
 
 
 @pytest.fixture(scope="session")
@@ -14,43 +52,113 @@ def api_base_url() -> str:
 
 @pytest.fixture(scope="session")
 def api_client(api_base_url: str):
-    """HTTP client for API requests."""
-    # Wait for the API to be ready
-    max_retries = 30
-    for i in range(max_retries):
-        try:
-            response = requests.get(f"{api_base_url}/health", timeout=5)
-            if response.status_code == 200:
-                break
-        except requests.exceptions.RequestException:
-            pass
-        time.sleep(1)
-    else:
-        pytest.fail("API is not responding after 30 seconds")
+    """HTTP client for API requests, shared by the whole test session.
     
-    return requests.Session()
+    Requests take paths relative to api_base_url, e.g. client.get(HEALTH).
+    """
+    client = httpx.Client(
+        base_url=api_base_url,
+        timeout=30.0,
+        transport=httpx.HTTPTransport(
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            retries=3
+        ),
+        event_hooks={"response": [_track_created_user]}
+    )
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """One event loop for the whole session, so session-scoped async fixtures can share it."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client(api_base_url: str):
+    """Async HTTP client for tests that issue independent requests concurrently."""
+    async with httpx.AsyncClient(
+        base_url=api_base_url,
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        event_hooks={"response": [_track_created_user_async]}
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _api_up(api_client):
+    """Skip the whole session at once when the API is down instead of timing out test by test."""
+    try:
+        response = api_client.get(HEALTH, timeout=2)
+    except httpx.HTTPError:
+        pytest.skip("API unreachable", allow_module_level=True)
+    if response.status_code != 200:
+        pytest.skip("API unhealthy", allow_module_level=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup(_api_up, api_client):
+    """Pay the LLM/embedding cold start once per session rather than in whichever test runs first."""
+    api_client.post(MEMORY, json={"message": "warmup", "user_id": _WARMUP_USER_ID})
+    api_client.get(SEARCH, params={"query": "warmup", "user_id": _WARMUP_USER_ID})
+
+
+@pytest.fixture(scope="session")
+def health_response(api_client) -> httpx.Response:
+    """Single /health response shared by every health test."""
+    return api_client.get(HEALTH)
+
+
+@pytest.fixture(scope="session")
+def executor():
+    """Thread pool shared by tests and fixtures that fan out concurrent requests."""
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        yield pool
+
+
+@pytest.fixture
+def user_id(request) -> str:
+    """User identifier unique to the running test, so parallel workers never share data."""
+    test_name = re.sub(r"\W", "_", request.node.name)
+    return f"{test_name}_{uuid.uuid4().hex[:8]}"
 
 
 @pytest.fixture
-def sample_memory_data() -> Dict[str, Any]:
+def other_user_id(user_id: str) -> str:
+    """A second user identifier for isolation tests."""
+    return f"{user_id}_other"
+
+
+@pytest.fixture
+def sample_memory_data(user_id: str) -> Dict[str, Any]:
     """Sample memory data for testing."""
-    return {
-        "message": "User prefers morning meetings and coffee",
-        "user_id": "test_user_123",
-        "metadata": {
-            "category": "preferences",
-            "importance": "high",
-            "tags": ["meetings", "coffee"]
-        }
-    }
+    return {**_SAMPLE_MEMORY, "user_id": user_id}
+
+
+@pytest.fixture(scope="session")
+def seeded_memory(api_client) -> Tuple[str, str]:
+    """Sample memory created once per session, as (user_id, memory_id).
+    
+    For read-only tests that just need an existing memory; tests that modify
+    or delete memories must create their own.
+    """
+    seed_user_id = f"seeded_{uuid.uuid4().hex[:8]}"
+    response = api_client.post(MEMORY, json={**_SAMPLE_MEMORY, "user_id": seed_user_id})
+    response.raise_for_status()
+    memories = _json(api_client.get(USER.format(seed_user_id)))["memories"]
+    return seed_user_id, memories[0]["id"]
 
 
 @pytest.fixture
-def another_memory_data() -> Dict[str, Any]:
+def another_memory_data(user_id: str) -> Dict[str, Any]:
     """Another sample memory for testing."""
     return {
         "message": "User is working on the mem0 project using FastAPI",
-        "user_id": "test_user_123",
+        "user_id": user_id,
         "metadata": {
             "category": "work",
             "project": "mem0",
@@ -60,11 +168,11 @@ def another_memory_data() -> Dict[str, Any]:
 
 
 @pytest.fixture
-def different_user_memory() -> Dict[str, Any]:
+def different_user_memory(other_user_id: str) -> Dict[str, Any]:
     """Memory data for a different user."""
     return {
         "message": "User loves Python programming and AI",
-        "user_id": "test_user_456",
+        "user_id": other_user_id,
         "metadata": {
             "category": "interests",
             "skills": ["python", "ai"]
@@ -72,37 +180,16 @@ def different_user_memory() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture(autouse=True)
-def cleanup_test_data(api_client, api_base_url):
-    """Cleanup test data after each test."""
+@pytest.fixture(scope="session", autouse=True)
+def cleanup_test_data(api_client, executor):
+    """Delete the memories of every user created during the session, once at session end."""
     yield
     
-    # Cleanup: Get all memories for test users and delete them
-    test_users = ["test_user_123", "test_user_456", "cleanup_user"]
-    
-    for user_id in test_users:
+    def delete_user_memories(user_id: str) -> None:
         try:
-            response = api_client.get(f"{api_base_url}/memory/user/{user_id}")
-            if response.status_code == 200:
-                memories = response.json().get("memories", [])
-                for memory in memories:
-                    if "id" in memory:
-                        api_client.delete(f"{api_base_url}/memory/{memory['id']}")
+            api_client.delete(USER.format(quote(user_id, safe="")))
         except Exception:
             # Ignore cleanup errors
             pass
-
-
-def assert_memory_structure(memory: Dict[str, Any]) -> None:
-    """Assert that a memory object has the expected structure."""
-    assert "id" in memory
-    assert "message" in memory
-    assert "user_id" in memory
-    assert "metadata" in memory
-    assert isinstance(memory["metadata"], dict)
-
-
-def assert_response_success(response: requests.Response) -> None:
-    """Assert that a response is successful."""
-    assert response.status_code in [200, 201], f"Expected success but got {response.status_code}: {response.text}"
-    assert response.headers.get("content-type", "").startswith("application/json")
\ No newline at end of file
+    
+    list(executor.map(delete_user_memories, _created_users))
@@ -0,0 +1,10 @@
+"""API routes used by the tests, relative to the client's base_url."""
+
+HEALTH = "/health"
+MEMORY = "/memory"
+MEMORY_BATCH = "/memory/batch"
+SEARCH = "/memory/search"
+SEARCH_BATCH = "/memory/search/batch"
+USER = "/memory/user/{}"
+BY_ID = "/memory/{}"
+HISTORY = "/memory/history/{}"
@@ -0,0 +1,45 @@
+"""Reusable multi-request test scenarios."""
+
+from typing import Any, Dict, Iterable
+
+import httpx
+
+from tests._helpers import _SUCCESS_STATUS_CODES, _json
+from tests.routes import MEMORY, USER, BY_ID
+
+# Update applied by the CRUD scenario unless the caller supplies one
+_DEFAULT_UPDATE = {
+    "message": "Updated memory message",
+    "metadata": {"updated": True}
+}
+
+
+def _check(step: str, response: httpx.Response, expected: Iterable[int] = _SUCCESS_STATUS_CODES) -> Any:
+    """Abort the scenario at the first failing step, naming it, and return the decoded body."""
+    if response.status_code not in expected:
+        raise AssertionError(f"{step}: expected {sorted(expected)} but got {response.status_code}: {response.text}")
+    return _json(response) if response.content else None
+
+
+def crud_scenario(client: httpx.Client, payload: Dict[str, Any], update: Dict[str, Any] = _DEFAULT_UPDATE) -> str:
+    """Create, read, update and delete one memory, then check it is gone.
+
+    Returns the id of the (now deleted) memory.
+    """
+    _check("create", client.post(MEMORY, json=payload))
+
+    # The add endpoint doesn't return the id, so find it among the user's memories
+    memories = _check("list user memories", client.get(USER.format(payload["user_id"])))["memories"]
+    if not memories:
+        raise AssertionError("list user memories: created memory not found")
+    memory_id = memories[0]["id"]
+
+    retrieved = _check("get by id", client.get(BY_ID.format(memory_id)))["memory"]
+    if retrieved["id"] != memory_id:
+        raise AssertionError(f"get by id: expected id {memory_id} but got {retrieved['id']}")
+
+    _check("update", client.put(BY_ID.format(memory_id), json=update))
+    _check("delete", client.delete(BY_ID.format(memory_id)))
+    _check("verify deletion", client.get(BY_ID.format(memory_id)), expected=(404,))
+
+    return memory_id
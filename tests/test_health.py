@@ -1,26 +1,21 @@
 """Tests for health endpoint."""
 
 import pytest
-import sys
-import os
-sys.path.append(os.path.dirname(__file__))
-from conftest import assert_response_success
+from tests._helpers import _json, assert_response_success
 
 
 @pytest.mark.unit
-def test_health_endpoint_returns_200(api_client, api_base_url):
+def test_health_endpoint_returns_200(health_response):
     """Test that health endpoint returns 200 status."""
-    response = api_client.get(f"{api_base_url}/health")
-    assert response.status_code == 200
+    assert health_response.status_code == 200
 
 
 @pytest.mark.unit
-def test_health_endpoint_structure(api_client, api_base_url):
+def test_health_endpoint_structure(health_response):
     """Test that health endpoint returns expected structure."""
-    response = api_client.get(f"{api_base_url}/health")
-    assert_response_success(response)
+    assert_response_success(health_response)
     
-    health_data = response.json()
+    health_data = _json(health_response)
     
     # Check required fields
     assert "status" in health_data
@@ -38,7 +33,6 @@ def test_health_endpoint_structure(api_client, api_base_url):
 
 
 @pytest.mark.unit
-def test_health_endpoint_content_type(api_client, api_base_url):
+def test_health_endpoint_content_type(health_response):
     """Test that health endpoint returns JSON content type."""
-    response = api_client.get(f"{api_base_url}/health")
-    assert response.headers.get("content-type", "").startswith("application/json")
\ No newline at end of file
+    assert health_response.headers.get("content-type", "").startswith("application/json")
\ No newline at end of file
@@ -0,0 +1,41 @@
+"""Tests that the API's search hits match mem0's own result format."""
+
+from types import SimpleNamespace
+
+import pytest
+
+msgspec = pytest.importorskip("msgspec")
+models = pytest.importorskip("qdrant_client.models")
+Memory = pytest.importorskip("mem0.memory.main").Memory
+app = pytest.importorskip("app")
+
+_POINT_ID = "5a542dfa-b95c-40c8-b89d-7350c3a7f39e"
+
+
+def _mem0_hits(point):
+    """Run a point through mem0's Memory._search_vector_store with stub embedder and store."""
+    memory = SimpleNamespace(
+        embedding_model=SimpleNamespace(embed=lambda query: [0.0]),
+        vector_store=SimpleNamespace(search=lambda query, limit, filters: [point])
+    )
+    return Memory._search_vector_store(memory, "coffee", {"user_id": point.payload["user_id"]}, 5)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("payload", [
+    {
+        "data": "Likes coffee in morning meetings",
+        "hash": "0c6a5f0e",
+        "created_at": "2024-01-01T09:00:00-08:00",
+        "updated_at": "2024-01-02T09:00:00-08:00",
+        "user_id": "user123",
+        "agent_id": "agent1",
+        "category": "preferences"
+    },
+    {"data": "Minimal payload", "user_id": "user123"},
+], ids=["full", "no-metadata"])
+def test_format_search_hit_matches_mem0(payload):
+    """Test that format_search_hit builds the same hit mem0 does for the same scored point."""
+    point = models.ScoredPoint(id=_POINT_ID, version=0, score=0.87, payload=payload)
+    
+    assert msgspec.to_builtins(app.format_search_hit(point)) == _mem0_hits(point)[0]